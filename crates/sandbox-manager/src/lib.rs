@@ -46,9 +46,11 @@ impl SandboxManager {
 
         let sandbox_path = self.sandboxes_path.join(sandbox_id.to_string());
 
-        if sandbox_path.exists() {
-            std::fs::remove_dir_all(&sandbox_path)
-                .map_err(|e| HybridLLMError::SandboxError(e.to_string()))?;
+        // Remove directly; a missing sandbox is not an error
+        match std::fs::remove_dir_all(&sandbox_path) {
+            Ok(()) => {}
+            Err(e) if e.kind() == std::io::ErrorKind::NotFound => {}
+            Err(e) => return Err(HybridLLMError::SandboxError(e.to_string())),
         }
 
         info!("✅ Sandbox destroyed: {}", sandbox_id);
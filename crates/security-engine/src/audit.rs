@@ -27,18 +27,18 @@ impl AuditLogger {
         approved: bool,
         reason: Option<String>,
     ) {
+        debug!("📋 Audit log: {} - {}", action, if approved { "✅" } else { "❌" });
+
         let entry = AuditLogEntry {
             id: Uuid::new_v4(),
             timestamp: Utc::now(),
             llm_id,
-            action: action.clone(),
+            action,
             details,
             approved,
             reason,
         };
 
-        debug!("📋 Audit log: {} - {}", action, if approved { "✅" } else { "❌" });
-
         let mut logs = self.logs.write().await;
         logs.push(entry);
     }
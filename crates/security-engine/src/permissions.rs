@@ -11,9 +11,9 @@ use tracing::{info, debug, warn};
 /// Manages permissions for LLMs
 pub struct PermissionManager {
     /// Global default permissions
-    global_scope: Arc<RwLock<PermissionScope>>,
+    global_scope: Arc<RwLock<Arc<PermissionScope>>>,
     /// Per-LLM permission overrides
-    llm_scopes: Arc<RwLock<HashMap<String, PermissionScope>>>,
+    llm_scopes: Arc<RwLock<HashMap<String, Arc<PermissionScope>>>>,
     /// Failed permission request tracking
     failed_requests: Arc<RwLock<HashMap<String, usize>>>,
 }
@@ -21,7 +21,7 @@ pub struct PermissionManager {
 impl PermissionManager {
     pub fn new() -> Self {
         Self {
-            global_scope: Arc::new(RwLock::new(PermissionScope::default())),
+            global_scope: Arc::new(RwLock::new(Arc::new(PermissionScope::default()))),
             llm_scopes: Arc::new(RwLock::new(HashMap::new())),
             failed_requests: Arc::new(RwLock::new(HashMap::new())),
         }
@@ -73,14 +73,15 @@ impl PermissionManager {
     }
 
     /// Get the applicable permission scope for an LLM
-    async fn get_scope(&self, llm_id: &str) -> PermissionScope {
+    /// Scopes are shared, so this is a refcount bump rather than a deep copy
+    async fn get_scope(&self, llm_id: &str) -> Arc<PermissionScope> {
         let llm_scopes = self.llm_scopes.read().await;
 
         if let Some(scope) = llm_scopes.get(llm_id) {
-            scope.clone()
+            Arc::clone(scope)
         } else {
             let global = self.global_scope.read().await;
-            global.clone()
+            Arc::clone(&global)
         }
     }
 
@@ -164,19 +165,19 @@ impl PermissionManager {
     /// Set global permission scope
     pub async fn set_global_scope(&self, scope: PermissionScope) {
         let mut global = self.global_scope.write().await;
-        *global = scope;
+        *global = Arc::new(scope);
     }
 
     /// Set per-LLM permission scope
     pub async fn set_llm_scope(&self, llm_id: &str, scope: PermissionScope) {
         let mut scopes = self.llm_scopes.write().await;
-        scopes.insert(llm_id.to_string(), scope);
+        scopes.insert(llm_id.to_string(), Arc::new(scope));
     }
 
     /// Get global permission scope
     pub async fn get_global_scope(&self) -> PermissionScope {
         let global = self.global_scope.read().await;
-        global.clone()
+        PermissionScope::clone(&global)
     }
 }
 